@@ -0,0 +1,318 @@
+"""Single-threaded request pipeline for one Unreal MCP connection (Protocol v1.1)."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import select
+import socket
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from protocol import (
+    FrameReader,
+    MalformedPayloadError,
+    ProtocolError,
+    current_timestamp_ms,
+    encode_frame,
+    write_all,
+    write_frame,
+)
+
+logger = logging.getLogger("UnrealMCP")
+
+# Heartbeats carry no per-call data, so the frame is encoded once.
+_PING_FRAME = encode_frame({"type": "ping"})
+
+_QueuedRequest = Tuple[bytes, str, Future]
+
+
+def _reply_request_id(message: Dict[str, Any]) -> Optional[str]:
+    meta = message.get("meta")
+    return meta.get("requestId") if isinstance(meta, dict) else None
+
+
+class IOWorker:
+    """Owns a connected socket and serves queued request frames on a worker thread.
+
+    Callers hand over encoded frames with ``submit`` and wait on the returned future;
+    only the worker thread touches the socket once ``start`` has been called.
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        *,
+        window_max: int = 16,
+        write_timeout: float = 5.0,
+        idle_timeout: float = 60.0,
+        heartbeat_interval: float = 15.0,
+        heartbeat_timeout: float = 2.0,
+        on_close: Optional[Callable[["IOWorker"], None]] = None,
+    ) -> None:
+        self.sock = sock
+        self.window_max = window_max
+        self.write_timeout = write_timeout
+        self.idle_timeout = idle_timeout
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self._on_close = on_close
+        self._reader = FrameReader(sock)
+        now = time.monotonic()
+        self._last_send = now
+        self._last_receive = now
+        # The lock only guards swapping the queue, never socket I/O.
+        self._lock = threading.Lock()
+        tx_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._queue: Optional[queue.SimpleQueue] = tx_queue
+        # Request ids whose caller already got READ_TIMEOUT; their late replies are skipped.
+        self._abandoned_requests: Set[str] = set()
+        self._thread = threading.Thread(target=self._run, args=(tx_queue,), name="UnrealMCP-IO", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def submit(self, frame: bytes, request_id: str) -> Future:
+        """Queue an encoded request frame and return its pending result."""
+
+        future: Future = Future()
+        with self._lock:
+            if self._queue is None:
+                raise ProtocolError("INTERNAL_ERROR", "Not connected to Unreal.")
+            self._queue.put((frame, request_id, future))
+        return future
+
+    def stop(self) -> None:
+        """Stop the worker and close the socket; queued requests fail."""
+
+        with self._lock:
+            tx_queue = self._queue
+            self._queue = None
+        if tx_queue is not None:
+            tx_queue.put(None)
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        self._thread.join(timeout)
+
+    def _run(self, tx_queue: queue.SimpleQueue) -> None:
+        """Serve queued requests until stopped or the transport fails."""
+
+        try:
+            while True:
+                batch, stop = self._next_batch(tx_queue)
+                if batch:
+                    if not self._send_batch(batch):
+                        break
+                elif not stop and not self._send_heartbeat():
+                    break
+                if stop:
+                    break
+        finally:
+            self._close(tx_queue)
+
+    def _next_batch(self, tx_queue: queue.SimpleQueue) -> Tuple[List[_QueuedRequest], bool]:
+        """Wait for one request, then drain whatever is already queued, up to ``window_max``.
+
+        Returns an empty batch once nothing has been sent for ``heartbeat_interval``, so
+        the heartbeat only fires when the session is actually quiet.
+        """
+
+        batch: List[_QueuedRequest] = []
+        idle_for = time.monotonic() - self._last_send
+        try:
+            item = tx_queue.get(timeout=max(0.0, self.heartbeat_interval - idle_for))
+        except queue.Empty:
+            return batch, False
+        while item is not None:
+            if item[2].set_running_or_notify_cancel():
+                batch.append(item)
+            if len(batch) >= self.window_max:
+                return batch, False
+            try:
+                item = tx_queue.get_nowait()
+            except queue.Empty:
+                return batch, False
+        return batch, True
+
+    def _send_heartbeat(self) -> bool:
+        """Keep an idle session alive so Unreal's inactivity timeout does not close it.
+
+        Control frames that arrived while idle are handled here too, so answering them
+        does not delay the reply to the next command.
+        """
+
+        try:
+            write_all(self.sock, _PING_FRAME, timeout=self.heartbeat_timeout)
+            self._last_send = time.monotonic()
+            self._drain_control_messages()
+        except (ProtocolError, OSError, ValueError) as exc:
+            # ValueError: select() on a socket that stop() has already closed.
+            logger.warning("Heartbeat to Unreal failed: %s", exc)
+            return False
+        return True
+
+    def _drain_control_messages(self) -> None:
+        reader = self._reader
+        while reader.has_complete_frame() or select.select([self.sock], [], [], 0)[0]:
+            try:
+                message = reader.read_frame(timeout=self.heartbeat_timeout)
+            except MalformedPayloadError as exc:
+                logger.warning("Discarding malformed frame while idle: %s", exc)
+                continue
+            except ProtocolError as exc:
+                if exc.code != "READ_TIMEOUT":
+                    raise
+                # Only part of a frame has arrived (e.g. a slow late reply); FrameReader
+                # keeps it buffered, so finish it on a later read instead of closing.
+                break
+            self._last_receive = time.monotonic()
+            if self._handle_control_message(message) or self._is_abandoned_reply(message):
+                continue
+            logger.warning("Discarding unexpected message while idle: %s", message.get("type"))
+
+    def _send_batch(self, batch: List[_QueuedRequest]) -> bool:
+        """Write every frame in ``batch`` with one send and resolve the replies in order.
+
+        Unreal handles a connection's messages sequentially, so responses arrive in the
+        same order as the requests were written.
+        """
+
+        data = batch[0][0] if len(batch) == 1 else b"".join(frame for frame, _, _ in batch)
+        pending: Deque[_QueuedRequest] = deque(batch)
+        try:
+            write_all(self.sock, data, timeout=self.write_timeout)
+            self._last_send = time.monotonic()
+            deadline = self._last_send + self.idle_timeout
+            while pending:
+                if self._dispatch_replies(pending, deadline):
+                    deadline = time.monotonic() + self.idle_timeout
+        except BaseException as exc:
+            while pending:
+                pending.popleft()[2].set_exception(exc)
+            return False
+        return True
+
+    def _dispatch_replies(self, pending: Deque[_QueuedRequest], deadline: float) -> bool:
+        """Resolve pending requests from one read plus every frame it left buffered.
+
+        Returns True when at least one request was completed or failed.
+        """
+
+        progressed = False
+        try:
+            for message in self._reader.read_frames(timeout=max(0.0, deadline - time.monotonic())):
+                self._last_receive = time.monotonic()
+                if self._handle_control_message(message) or self._is_abandoned_reply(message):
+                    continue
+                future = self._take_pending(pending, message)
+                if future is None:
+                    continue
+                future.set_result(message)
+                progressed = True
+                if not pending:
+                    break
+        except MalformedPayloadError as exc:
+            # A bad frame has no readable requestId, so like an id-less reply it can
+            # only be matched by order, which a timed-out request's reply may break.
+            if self._abandoned_requests:
+                raise ProtocolError(
+                    "INTERNAL_ERROR",
+                    "Cannot match a malformed reply after a timed-out request.",
+                ) from exc
+            # The bad frame was consumed whole; fail this request only.
+            pending.popleft()[2].set_exception(exc)
+            progressed = True
+        except ProtocolError as exc:
+            if exc.code != "READ_TIMEOUT":
+                raise
+            # FrameReader keeps any partial frame buffered, so the stream stays
+            # aligned; skip this reply if it turns up later and keep the socket.
+            _, request_id, future = pending.popleft()
+            self._abandoned_requests.add(request_id)
+            future.set_exception(exc)
+            progressed = True
+        return progressed
+
+    def _take_pending(self, pending: Deque[_QueuedRequest], message: Dict[str, Any]) -> Optional[Future]:
+        """Remove and return the future of the pending request ``message`` answers.
+
+        Replies normally carry ``meta.requestId``; the plugin's generic error responses
+        do not, and can only be matched by order. Once a timed-out request's reply may
+        still be in flight that order is unknown, so the connection is reset instead.
+        """
+
+        request_id = _reply_request_id(message)
+        if request_id is None:
+            if self._abandoned_requests:
+                raise ProtocolError(
+                    "INTERNAL_ERROR",
+                    "Cannot match a reply without requestId after a timed-out request.",
+                )
+            return pending.popleft()[2]
+        for index, (_, pending_id, future) in enumerate(pending):
+            if pending_id == request_id:
+                del pending[index]
+                return future
+        logger.warning("Discarding reply for unknown request %s", request_id)
+        return None
+
+    def _is_abandoned_reply(self, message: Dict[str, Any]) -> bool:
+        if not self._abandoned_requests:
+            return False
+        request_id = _reply_request_id(message)
+        if request_id in self._abandoned_requests:
+            self._abandoned_requests.discard(request_id)
+            logger.debug("Skipping late reply for timed-out request %s", request_id)
+            return True
+        return False
+
+    def _handle_control_message(self, message: Dict[str, Any]) -> bool:
+        message_type = message.get("type")
+        if message_type == "ping":
+            timestamp = int(message.get("ts", current_timestamp_ms()))
+            try:
+                write_frame(self.sock, {"type": "pong", "ts": timestamp}, timeout=self.write_timeout)
+                self._last_send = time.monotonic()
+                logger.debug("Responded to ping (%s)", timestamp)
+            except ProtocolError as exc:
+                logger.error("Failed to respond to ping: %s", exc)
+                raise
+            return True
+
+        if message_type == "pong":
+            logger.debug("Received pong (%s)", message.get("ts"))
+            return True
+
+        return False
+
+    def _close(self, tx_queue: queue.SimpleQueue) -> None:
+        with self._lock:
+            self._queue = None
+
+        try:
+            self.sock.close()
+        except OSError:
+            pass
+
+        if self._on_close is not None:
+            self._on_close(self)
+
+        while True:
+            try:
+                item = tx_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                continue
+            _, _, future = item
+            if future.set_running_or_notify_cancel():
+                future.set_exception(
+                    ProtocolError("INTERNAL_ERROR", "Connection closed before the request was sent.")
+                )
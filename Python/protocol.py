@@ -6,10 +6,16 @@ import json
 import socket
 import struct
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional dependency
+    orjson = None  # type: ignore
 
 HEADER_SIZE = 4
 MAX_FRAME_SIZE = 4 * 1024 * 1024  # 4 MiB safety limit
+_EMPTY_OBJECT_JSON = b"{}"
 
 
 class ProtocolError(Exception):
@@ -31,8 +37,36 @@ class ProtocolError(Exception):
         }
 
 
+class MalformedPayloadError(ProtocolError):
+    """A complete frame was read but its body is not valid JSON.
+
+    The frame has been consumed in full, so the stream is still aligned on the next
+    frame boundary and the connection remains usable.
+    """
+
+    def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
+        super().__init__("MALFORMED_FRAME", message, details)
+
+
+def encode_json(payload: Any) -> bytes:
+    """Serialize ``payload`` to UTF-8 JSON bytes, using orjson when it is installed."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+# Resolved once at import so the per-frame decode path skips the backend check.
+_json_loads = orjson.loads if orjson is not None else json.loads
+_JSON_DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+
+
 def _wait_for_socket(sock: socket.socket, timeout: Optional[float]) -> None:
     if timeout is not None:
+        # settimeout(0.0) would make the socket non-blocking and turn an expired
+        # deadline into BlockingIOError, so report it as a timeout instead.
+        if timeout <= 0.0:
+            raise socket.timeout("deadline expired")
         sock.settimeout(timeout)
 
 
@@ -49,33 +83,34 @@ def _remaining_time(deadline: Optional[float]) -> Optional[float]:
     return max(0.0, remaining)
 
 
-def read_exact(sock: socket.socket, size: int, timeout: Optional[float] = None) -> bytes:
+def read_exact(sock: socket.socket, size: int, timeout: Optional[float] = None) -> bytearray:
     """Read exactly ``size`` bytes from ``sock`` respecting ``timeout``."""
 
     if size <= 0:
-        return b""
+        return bytearray()
 
     deadline = _monotonic_deadline(timeout)
-    chunks: list[bytes] = []
-    remaining = size
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    received = 0
 
-    while remaining > 0:
+    while received < size:
         chunk_timeout = _remaining_time(deadline)
         try:
             _wait_for_socket(sock, chunk_timeout)
-            chunk = sock.recv(remaining)
+            count = sock.recv_into(view[received:])
         except socket.timeout as exc:  # pragma: no cover - depends on OS timing
             raise ProtocolError("READ_TIMEOUT", "Timed out while reading from socket.") from exc
         except OSError as exc:  # pragma: no cover - rare transport errors
             raise ProtocolError("MALFORMED_FRAME", f"Socket read failed: {exc}") from exc
 
-        if not chunk:
+        if not count:
             raise ProtocolError("MALFORMED_FRAME", "Socket closed while reading data.")
 
-        chunks.append(chunk)
-        remaining -= len(chunk)
+        received += count
 
-    return b"".join(chunks)
+    view.release()
+    return buffer
 
 
 def write_all(sock: socket.socket, data: bytes, timeout: Optional[float] = None) -> None:
@@ -104,31 +139,145 @@ def write_all(sock: socket.socket, data: bytes, timeout: Optional[float] = None)
         total_sent += sent
 
 
+def _frame_body(body: bytes) -> bytes:
+    if len(body) > MAX_FRAME_SIZE:
+        raise ProtocolError("MALFORMED_FRAME", "Payload exceeds maximum frame size.", {"length": len(body)})
+
+    return struct.pack("<I", len(body)) + body
+
+
+def encode_frame(payload: Dict[str, Any]) -> bytes:
+    """Encode ``payload`` as a complete frame (length header followed by the JSON body)."""
+
+    return _frame_body(encode_json(payload))
+
+
+def encode_command_frame(command: str, params: Dict[str, Any], request_id: str, ts_ms: float) -> bytes:
+    """Encode a command request frame.
+
+    Equivalent to ``encode_frame`` on the request envelope, but only the variable parts
+    are serialized; the envelope keys are spliced in as constant bytes and the request
+    id is encoded once for its three occurrences.
+    """
+
+    encoded_id = encode_json(request_id)
+    body = b"".join(
+        (
+            b'{"type":',
+            encode_json(command),
+            b',"params":',
+            encode_json(params) if params else _EMPTY_OBJECT_JSON,
+            b',"requestId":',
+            encoded_id,
+            b',"idempotencyKey":',
+            encoded_id,
+            b',"meta":{"requestId":',
+            encoded_id,
+            b',"ts":',
+            encode_json(ts_ms),
+            b"}}",
+        )
+    )
+    return _frame_body(body)
+
+
 def write_frame(sock: socket.socket, payload: Dict[str, Any], timeout: Optional[float] = None) -> None:
     """Encode ``payload`` as JSON and send it as a framed message."""
 
-    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
-    if len(body) > MAX_FRAME_SIZE:
-        raise ProtocolError("MALFORMED_FRAME", "Payload exceeds maximum frame size.", {"length": len(body)})
+    write_all(sock, encode_frame(payload), timeout)
 
-    header = struct.pack("<I", len(body))
-    write_all(sock, header, timeout)
-    write_all(sock, body, timeout)
+
+def _parse_length(header: bytes) -> int:
+    (length,) = struct.unpack_from("<I", header)
+    if length == 0 or length > MAX_FRAME_SIZE:
+        raise ProtocolError("MALFORMED_FRAME", "Invalid frame length.", {"length": length})
+    return length
+
+
+def _decode_payload(payload: bytes) -> Dict[str, Any]:
+    try:
+        return _json_loads(payload)
+    except _JSON_DECODE_ERRORS as exc:
+        raise MalformedPayloadError("Invalid JSON payload.", {"length": len(payload)}) from exc
 
 
 def read_frame(sock: socket.socket, timeout: Optional[float] = None) -> Dict[str, Any]:
     """Read a single framed JSON message from ``sock``."""
 
     header = read_exact(sock, HEADER_SIZE, timeout)
-    (length,) = struct.unpack("<I", header)
-    if length == 0 or length > MAX_FRAME_SIZE:
-        raise ProtocolError("MALFORMED_FRAME", "Invalid frame length.", {"length": length})
-
+    length = _parse_length(header)
     payload = read_exact(sock, length, timeout)
-    try:
-        return json.loads(payload.decode("utf-8"))
-    except json.JSONDecodeError as exc:
-        raise ProtocolError("MALFORMED_FRAME", "Invalid JSON payload.") from exc
+    return _decode_payload(payload)
+
+
+class FrameReader:
+    """Buffered frame reader for a long-lived socket.
+
+    Each ``recv_into`` pulls up to ``buffer_size`` bytes into a reused buffer, so a
+    small frame's header and body usually arrive in a single syscall. Once a reader
+    is attached, all reads on the socket must go through it.
+    """
+
+    def __init__(self, sock: socket.socket, buffer_size: int = 65536) -> None:
+        self._sock = sock
+        self._recv_buf = bytearray(buffer_size)
+        self._recv_view = memoryview(self._recv_buf)
+        self._pending = bytearray()
+
+    @property
+    def buffered(self) -> int:
+        """Number of received bytes not yet consumed as frames."""
+
+        return len(self._pending)
+
+    def read_frame(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Read the next framed JSON message, within ``timeout`` seconds overall."""
+
+        deadline = _monotonic_deadline(timeout)
+        self._fill(HEADER_SIZE, deadline)
+        length = _parse_length(self._pending)
+        end = HEADER_SIZE + length
+        self._fill(end, deadline)
+        payload = self._pending[HEADER_SIZE:end]
+        del self._pending[:end]
+        return _decode_payload(payload)
+
+    def read_frames(self, timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """Yield the next frame, then every further frame already complete in the buffer.
+
+        Only the first frame may wait on the socket; the rest are parsed from bytes
+        pulled in by the same ``recv_into`` calls.
+        """
+
+        yield self.read_frame(timeout)
+        while self.has_complete_frame():
+            yield self.read_frame()
+
+    def has_complete_frame(self) -> bool:
+        """Whether a whole frame is buffered, so ``read_frame`` will not touch the socket."""
+
+        if len(self._pending) < HEADER_SIZE:
+            return False
+        (length,) = struct.unpack_from("<I", self._pending)
+        return len(self._pending) >= HEADER_SIZE + length
+
+    def _fill(self, size: int, deadline: Optional[float]) -> None:
+        sock = self._sock
+        view = self._recv_view
+        pending = self._pending
+        while len(pending) < size:
+            try:
+                _wait_for_socket(sock, _remaining_time(deadline))
+                count = sock.recv_into(view)
+            except socket.timeout as exc:  # pragma: no cover - depends on OS timing
+                raise ProtocolError("READ_TIMEOUT", "Timed out while reading from socket.") from exc
+            except OSError as exc:  # pragma: no cover - rare transport errors
+                raise ProtocolError("MALFORMED_FRAME", f"Socket read failed: {exc}") from exc
+
+            if not count:
+                raise ProtocolError("MALFORMED_FRAME", "Socket closed while reading data.")
+
+            pending += view[:count]
 
 
 def make_error(code: str, message: str, details: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
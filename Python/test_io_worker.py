@@ -0,0 +1,266 @@
+import socket
+import struct
+import time
+from concurrent.futures import wait as futures_wait
+
+import pytest
+
+from io_worker import IOWorker
+from protocol import MalformedPayloadError, ProtocolError, encode_command_frame, encode_frame, read_frame
+
+
+def _request(request_id: str) -> bytes:
+    return encode_command_frame("get_actors_in_level", {}, request_id, 0)
+
+
+def _reply(request_id: str, **extra) -> bytes:
+    return encode_frame({"ok": True, "meta": {"requestId": request_id}, **extra})
+
+
+def _read_request(server: socket.socket) -> dict:
+    """Read the next request frame, skipping heartbeats."""
+
+    while True:
+        message = read_frame(server, timeout=2.0)
+        if message.get("type") != "ping":
+            return message
+
+
+@pytest.fixture
+def sockets():
+    client, server = socket.socketpair()
+    yield client, server
+    client.close()
+    server.close()
+
+
+def test_batch_replies_resolve_in_order(sockets):
+    client, server = sockets
+    worker = IOWorker(client, window_max=8)
+    ids = ["a", "b", "c"]
+    # Queued before the thread starts, so all three go out as one batch.
+    futures = [worker.submit(_request(request_id), request_id) for request_id in ids]
+    worker.start()
+
+    received = [read_frame(server, timeout=2.0)["requestId"] for _ in ids]
+    assert received == ids
+    server.sendall(b"".join(_reply(request_id, n=index) for index, request_id in enumerate(ids)))
+
+    done, _ = futures_wait(futures, timeout=2.0)
+    assert len(done) == len(ids)
+    assert [future.result()["n"] for future in futures] == [0, 1, 2]
+
+    worker.stop()
+    worker.join(2.0)
+
+
+def test_server_close_fails_sent_and_queued_requests(sockets):
+    client, server = sockets
+    closed = []
+    worker = IOWorker(client, window_max=1, on_close=closed.append)
+    futures = [worker.submit(_request(request_id), request_id) for request_id in ("a", "b", "c")]
+    worker.start()
+
+    assert read_frame(server, timeout=2.0)["requestId"] == "a"
+    server.close()
+
+    done, _ = futures_wait(futures, timeout=2.0)
+    assert len(done) == len(futures)
+    for future in futures:
+        with pytest.raises(ProtocolError):
+            future.result()
+    assert futures[1].exception().code == "INTERNAL_ERROR"
+
+    worker.join(2.0)
+    assert closed == [worker]
+    with pytest.raises(ProtocolError):
+        worker.submit(_request("d"), "d")
+
+
+def test_stop_fails_queued_requests(sockets):
+    client, _ = sockets
+    worker = IOWorker(client)
+    future = worker.submit(_request("a"), "a")
+    worker.stop()
+    worker.start()
+
+    assert isinstance(future.exception(timeout=2.0), ProtocolError)
+    worker.join(2.0)
+
+
+def _malformed_frame() -> bytes:
+    return struct.pack("<I", 5) + b"{bad}"
+
+
+def test_malformed_reply_fails_only_its_request(sockets):
+    client, server = sockets
+    closed = []
+    worker = IOWorker(client, on_close=closed.append)
+    futures = [worker.submit(_request(request_id), request_id) for request_id in ("a", "b")]
+    worker.start()
+
+    for _ in futures:
+        read_frame(server, timeout=2.0)
+    server.sendall(_malformed_frame() + _reply("b"))
+
+    assert isinstance(futures[0].exception(timeout=2.0), MalformedPayloadError)
+    assert futures[1].result(timeout=2.0)["meta"]["requestId"] == "b"
+    assert closed == []
+
+    worker.stop()
+    worker.join(2.0)
+
+
+def _time_out_first_request(worker: IOWorker, server: socket.socket):
+    timed_out = worker.submit(_request("a"), "a")
+    worker.start()
+    assert _read_request(server)["requestId"] == "a"
+    assert timed_out.exception(timeout=2.0).code == "READ_TIMEOUT"
+
+    follow_up = worker.submit(_request("b"), "b")
+    assert _read_request(server)["requestId"] == "b"
+    return follow_up
+
+
+def test_late_reply_after_timeout_is_skipped(sockets):
+    client, server = sockets
+    worker = IOWorker(client, idle_timeout=0.2)
+    follow_up = _time_out_first_request(worker, server)
+
+    server.sendall(_reply("a", late=True) + _reply("b"))
+    result = follow_up.result(timeout=2.0)
+    assert result["meta"]["requestId"] == "b"
+    assert "late" not in result
+
+    worker.stop()
+    worker.join(2.0)
+
+
+def test_late_reply_without_request_id_resets_connection(sockets):
+    client, server = sockets
+    closed = []
+    worker = IOWorker(client, idle_timeout=0.2, on_close=closed.append)
+    follow_up = _time_out_first_request(worker, server)
+
+    # The plugin's generic error replies carry no meta, so they cannot be matched.
+    error = {"ok": False, "error": {"code": "INTERNAL_ERROR", "message": "Failed to parse command response."}}
+    server.sendall(encode_frame(error) + _reply("b"))
+    assert follow_up.exception(timeout=2.0).code == "INTERNAL_ERROR"
+
+    worker.join(2.0)
+    assert closed == [worker]
+
+
+def test_malformed_late_reply_resets_connection(sockets):
+    client, server = sockets
+    closed = []
+    worker = IOWorker(client, idle_timeout=0.2, on_close=closed.append)
+    follow_up = _time_out_first_request(worker, server)
+
+    # The bad frame may be the timed-out request's reply, so it cannot be pinned on "b".
+    server.sendall(_malformed_frame() + _reply("b"))
+    assert follow_up.exception(timeout=2.0).code == "INTERNAL_ERROR"
+
+    worker.join(2.0)
+    assert closed == [worker]
+
+
+def test_partial_frame_while_idle_keeps_connection(sockets):
+    client, server = sockets
+    closed = []
+    worker = IOWorker(client, heartbeat_interval=0.05, heartbeat_timeout=0.05, on_close=closed.append)
+    worker.start()
+
+    pong = encode_frame({"type": "pong", "ts": 1})
+    server.sendall(pong[:3])
+    time.sleep(0.3)
+    assert closed == []
+
+    server.sendall(pong[3:])
+    future = worker.submit(_request("a"), "a")
+    assert _read_request(server)["requestId"] == "a"
+    server.sendall(_reply("a"))
+    assert future.result(timeout=2.0)["meta"]["requestId"] == "a"
+    assert closed == []
+
+    worker.stop()
+    worker.join(2.0)
+
+
+def test_heartbeat_pings_after_idle_interval(sockets):
+    client, server = sockets
+    worker = IOWorker(client, heartbeat_interval=0.1)
+    started = time.monotonic()
+    worker.start()
+
+    assert read_frame(server, timeout=2.0) == {"type": "ping"}
+    assert time.monotonic() - started >= 0.09
+
+    worker.stop()
+    worker.join(2.0)
+
+
+def test_idle_worker_answers_unreal_ping(sockets):
+    client, server = sockets
+    worker = IOWorker(client, heartbeat_interval=0.05)
+    worker.start()
+
+    server.sendall(encode_frame({"type": "ping", "ts": 7}))
+    while True:
+        message = read_frame(server, timeout=2.0)
+        if message.get("type") == "pong":
+            break
+    assert message["ts"] == 7
+
+    worker.stop()
+    worker.join(2.0)
+
+
+def test_idle_worker_skips_abandoned_reply(sockets):
+    client, server = sockets
+    closed = []
+    worker = IOWorker(client, idle_timeout=0.2, heartbeat_interval=0.05, on_close=closed.append)
+    timed_out = worker.submit(_request("a"), "a")
+    worker.start()
+    assert _read_request(server)["requestId"] == "a"
+    assert timed_out.exception(timeout=2.0).code == "READ_TIMEOUT"
+
+    # Arrives while idle and is dropped by the heartbeat's drain.
+    server.sendall(_reply("a", late=True))
+    time.sleep(0.2)
+
+    # With nothing left abandoned, an id-less reply is matched by order again.
+    future = worker.submit(_request("b"), "b")
+    assert _read_request(server)["requestId"] == "b"
+    server.sendall(encode_frame({"ok": False, "error": {"code": "INTERNAL_ERROR", "message": "x"}}))
+    assert future.result(timeout=2.0)["ok"] is False
+    assert closed == []
+
+    worker.stop()
+    worker.join(2.0)
+
+
+def test_no_heartbeat_while_requests_keep_flowing(sockets):
+    client, server = sockets
+    worker = IOWorker(client, heartbeat_interval=0.2)
+    worker.start()
+
+    # Runs well past the interval, but the idle time is measured from the last send.
+    deadline = time.monotonic() + 0.6
+    count = 0
+    while time.monotonic() < deadline:
+        request_id = f"r{count}"
+        future = worker.submit(_request(request_id), request_id)
+        message = read_frame(server, timeout=2.0)
+        assert message.get("requestId") == request_id
+        server.sendall(_reply(request_id))
+        future.result(timeout=2.0)
+        count += 1
+        time.sleep(0.05)
+
+    server.setblocking(False)
+    with pytest.raises(BlockingIOError):
+        server.recv(1)
+
+    worker.stop()
+    worker.join(2.0)
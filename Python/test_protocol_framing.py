@@ -1,9 +1,18 @@
 import json
+import socket
 from typing import Any, Dict
 
 import pytest
 
-from protocol import ProtocolError, current_timestamp_ms, read_frame, write_frame
+from protocol import (
+    FrameReader,
+    MalformedPayloadError,
+    ProtocolError,
+    current_timestamp_ms,
+    encode_command_frame,
+    read_frame,
+    write_frame,
+)
 
 
 class FakeSocket:
@@ -27,6 +36,11 @@ class FakeSocket:
         self._read_offset = end
         return chunk
 
+    def recv_into(self, buffer) -> int:
+        chunk = self.recv(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
     # Helpers for tests
     def buffer(self) -> bytes:
         return bytes(self._buffer)
@@ -42,6 +56,15 @@ def test_write_and_read_frame_roundtrip():
     assert result == payload
 
 
+def test_write_and_read_frame_non_ascii_roundtrip():
+    payload: Dict[str, Any] = {"type": "test", "path": "/Game/Décor/Été", "ids": [1, 2, 3]}
+    writer = FakeSocket()
+    write_frame(writer, payload)
+
+    reader = FakeSocket(writer.buffer())
+    assert read_frame(reader) == payload
+
+
 def test_read_frame_invalid_length_raises():
     writer = FakeSocket()
     # Write header with invalid huge length
@@ -72,7 +95,97 @@ def test_write_frame_too_large():
     assert exc.value.code == "MALFORMED_FRAME"
 
 
+def test_frame_reader_reads_consecutive_frames():
+    writer = FakeSocket()
+    payloads = [
+        {"type": "pong", "ts": 1},
+        {"ok": True, "result": {"value": 1}},
+        {"ok": True, "result": {"value": 2}},
+    ]
+    for payload in payloads:
+        write_frame(writer, payload)
+
+    reader = FrameReader(FakeSocket(writer.buffer()))
+    assert [reader.read_frame() for _ in payloads] == payloads
+    assert reader.buffered == 0
+
+
+def test_frame_reader_read_frames_drains_buffered_frames():
+    writer = FakeSocket()
+    for value in range(3):
+        write_frame(writer, {"value": value})
+    sock = FakeSocket(writer.buffer())
+    reader = FrameReader(sock)
+
+    assert [frame["value"] for frame in reader.read_frames()] == [0, 1, 2]
+    assert sock._read_offset == len(sock.buffer())
+
+
+def test_frame_reader_frame_larger_than_buffer():
+    payload = {"type": "big", "data": "x" * 10000}
+    writer = FakeSocket()
+    write_frame(writer, payload)
+
+    reader = FrameReader(FakeSocket(writer.buffer()), buffer_size=1024)
+    assert reader.read_frame() == payload
+
+
+def test_frame_reader_truncated_payload():
+    payload = json.dumps({"type": "partial"}).encode("utf-8")
+    data = (len(payload) + 10).to_bytes(4, "little") + payload
+
+    with pytest.raises(ProtocolError) as exc:
+        FrameReader(FakeSocket(data)).read_frame()
+    assert exc.value.code == "MALFORMED_FRAME"
+
+
+def test_frame_reader_invalid_json_keeps_stream_aligned():
+    body = b"{not json"
+    writer = FakeSocket(len(body).to_bytes(4, "little") + body)
+    write_frame(writer, {"type": "pong", "ts": 7})
+
+    reader = FrameReader(FakeSocket(writer.buffer()))
+    with pytest.raises(MalformedPayloadError) as exc:
+        reader.read_frame()
+    assert exc.value.code == "MALFORMED_FRAME"
+    assert reader.read_frame() == {"type": "pong", "ts": 7}
+
+
+def test_encode_command_frame_matches_envelope():
+    frame = encode_command_frame("spawn_actor", {"name": "Cubé", "location": [0, 1.5, 2]}, "req-1", 1700000000123.5)
+
+    assert read_frame(FakeSocket(frame)) == {
+        "type": "spawn_actor",
+        "params": {"name": "Cubé", "location": [0, 1.5, 2]},
+        "requestId": "req-1",
+        "idempotencyKey": "req-1",
+        "meta": {"requestId": "req-1", "ts": 1700000000123.5},
+    }
+
+
+def test_encode_command_frame_empty_params():
+    frame = encode_command_frame("get_actors_in_level", {}, "req-2", 1.0)
+
+    assert read_frame(FakeSocket(frame))["params"] == {}
+
+
 def test_current_timestamp_ms():
     ts = current_timestamp_ms()
     assert isinstance(ts, int)
     assert ts > 0
+
+
+def test_frame_reader_expired_deadline_is_read_timeout():
+    client, server = socket.socketpair()
+    try:
+        reader = FrameReader(client)
+        with pytest.raises(ProtocolError) as excinfo:
+            reader.read_frame(timeout=0.0)
+        assert excinfo.value.code == "READ_TIMEOUT"
+
+        # The socket is left blocking, so a later read with time to spare still works.
+        write_frame(server, {"type": "pong"})
+        assert reader.read_frame(timeout=2.0) == {"type": "pong"}
+    finally:
+        client.close()
+        server.close()
@@ -39,7 +39,7 @@ def register_blueprint_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Blueprint creation response: {response}")
+            logger.info("Blueprint creation response: %s", response)
             return response or {}
             
         except Exception as e:
@@ -104,14 +104,14 @@ def register_blueprint_tools(mcp: FastMCP):
                 logger.error("Failed to connect to Unreal Engine")
                 return {"success": False, "message": "Failed to connect to Unreal Engine"}
                 
-            logger.info(f"Adding component to blueprint with params: {params}")
+            logger.info("Adding component to blueprint with params: %s", params)
             response = unreal.send_command("add_component_to_blueprint", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Component addition response: {response}")
+            logger.info("Component addition response: %s", response)
             return response
             
         except Exception as e:
@@ -151,14 +151,14 @@ def register_blueprint_tools(mcp: FastMCP):
                 "static_mesh": static_mesh
             }
             
-            logger.info(f"Setting static mesh properties with params: {params}")
+            logger.info("Setting static mesh properties with params: %s", params)
             response = unreal.send_command("set_static_mesh_properties", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Set static mesh properties response: {response}")
+            logger.info("Set static mesh properties response: %s", response)
             return response
             
         except Exception as e:
@@ -190,14 +190,14 @@ def register_blueprint_tools(mcp: FastMCP):
                 "property_value": property_value
             }
             
-            logger.info(f"Setting component property with params: {params}")
+            logger.info("Setting component property with params: %s", params)
             response = unreal.send_command("set_component_property", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Set component property response: {response}")
+            logger.info("Set component property response: %s", response)
             return response
             
         except Exception as e:
@@ -235,14 +235,14 @@ def register_blueprint_tools(mcp: FastMCP):
                 "angular_damping": float(angular_damping)
             }
             
-            logger.info(f"Setting physics properties with params: {params}")
+            logger.info("Setting physics properties with params: %s", params)
             response = unreal.send_command("set_physics_properties", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Set physics properties response: {response}")
+            logger.info("Set physics properties response: %s", response)
             return response
             
         except Exception as e:
@@ -275,7 +275,7 @@ def register_blueprint_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Compile blueprint response: {response}")
+            logger.info("Compile blueprint response: %s", response)
             return response
             
         except Exception as e:
@@ -315,14 +315,14 @@ def register_blueprint_tools(mcp: FastMCP):
                 "property_value": property_value
             }
             
-            logger.info(f"Setting blueprint property with params: {params}")
+            logger.info("Setting blueprint property with params: %s", params)
             response = unreal.send_command("set_blueprint_property", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Set blueprint property response: {response}")
+            logger.info("Set blueprint property response: %s", response)
             return response
             
         except Exception as e:
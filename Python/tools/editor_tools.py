@@ -32,7 +32,7 @@ def register_editor_tools(mcp: FastMCP):
                 return []
                 
             # Log the complete response for debugging
-            logger.info(f"Complete response from Unreal: {response}")
+            logger.info("Complete response from Unreal: %s", response)
             
             # Check response format
             if "result" in response and "actors" in response["result"]:
@@ -44,7 +44,7 @@ def register_editor_tools(mcp: FastMCP):
                 logger.info(f"Found {len(actors)} actors in level")
                 return actors
                 
-            logger.warning(f"Unexpected response format: {response}")
+            logger.warning("Unexpected response format: %s", response)
             return []
             
         except Exception as e:
@@ -120,7 +120,7 @@ def register_editor_tools(mcp: FastMCP):
                 # Ensure all values are float
                 params[param_name] = [float(val) for val in param_value]
             
-            logger.info(f"Creating actor '{name}' of type '{type}' with params: {params}")
+            logger.info("Creating actor '%s' of type '%s' with params: %s", name, type, params)
             response = unreal.send_command("spawn_actor", params)
             
             if not response:
@@ -128,7 +128,7 @@ def register_editor_tools(mcp: FastMCP):
                 return {"success": False, "message": "No response from Unreal Engine"}
             
             # Log the complete response for debugging
-            logger.info(f"Actor creation response: {response}")
+            logger.info("Actor creation response: %s", response)
             
             # Handle error responses correctly
             if response.get("status") == "error":
@@ -251,7 +251,7 @@ def register_editor_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Set actor property response: {response}")
+            logger.info("Set actor property response: %s", response)
             return response
             
         except Exception as e:
@@ -351,14 +351,14 @@ def register_editor_tools(mcp: FastMCP):
                 # Ensure all values are float
                 params[param_name] = [float(val) for val in param_value]
             
-            logger.info(f"Spawning blueprint actor with params: {params}")
+            logger.info("Spawning blueprint actor with params: %s", params)
             response = unreal.send_command("spawn_blueprint_actor", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Spawn blueprint actor response: {response}")
+            logger.info("Spawn blueprint actor response: %s", response)
             return response
             
         except Exception as e:
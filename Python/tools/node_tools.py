@@ -60,7 +60,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Event node creation response: {response}")
+            logger.info("Event node creation response: %s", response)
             return response
             
         except Exception as e:
@@ -111,7 +111,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Input action node creation response: {response}")
+            logger.info("Input action node creation response: %s", response)
             return response
             
         except Exception as e:
@@ -170,7 +170,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Function node creation response: {response}")
+            logger.info("Function node creation response: %s", response)
             return response
             
         except Exception as e:
@@ -223,7 +223,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Node connection response: {response}")
+            logger.info("Node connection response: %s", response)
             return response
             
         except Exception as e:
@@ -273,7 +273,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Variable creation response: {response}")
+            logger.info("Variable creation response: %s", response)
             return response
             
         except Exception as e:
@@ -325,7 +325,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Self component reference node creation response: {response}")
+            logger.info("Self component reference node creation response: %s", response)
             return response
             
         except Exception as e:
@@ -372,7 +372,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Self reference node creation response: {response}")
+            logger.info("Self reference node creation response: %s", response)
             return response
             
         except Exception as e:
@@ -419,7 +419,7 @@ def register_blueprint_node_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Node find response: {response}")
+            logger.info("Node find response: %s", response)
             return response
             
         except Exception as e:
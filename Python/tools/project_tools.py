@@ -53,7 +53,7 @@ def register_project_tools(mcp: FastMCP):
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Input mapping creation response: {response}")
+            logger.info("Input mapping creation response: %s", response)
             return response
             
         except Exception as e:
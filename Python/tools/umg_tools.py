@@ -46,14 +46,14 @@ def register_umg_tools(mcp: FastMCP):
                 "path": path
             }
             
-            logger.info(f"Creating UMG Widget Blueprint with params: {params}")
+            logger.info("Creating UMG Widget Blueprint with params: %s", params)
             response = unreal.send_command("create_umg_widget_blueprint", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Create UMG Widget Blueprint response: {response}")
+            logger.info("Create UMG Widget Blueprint response: %s", response)
             return response
             
         except Exception as e:
@@ -105,14 +105,14 @@ def register_umg_tools(mcp: FastMCP):
                 "color": color
             }
             
-            logger.info(f"Adding Text Block to widget with params: {params}")
+            logger.info("Adding Text Block to widget with params: %s", params)
             response = unreal.send_command("add_text_block_to_widget", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Add Text Block response: {response}")
+            logger.info("Add Text Block response: %s", response)
             return response
             
         except Exception as e:
@@ -167,14 +167,14 @@ def register_umg_tools(mcp: FastMCP):
                 "background_color": background_color
             }
             
-            logger.info(f"Adding Button to widget with params: {params}")
+            logger.info("Adding Button to widget with params: %s", params)
             response = unreal.send_command("add_button_to_widget", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Add Button response: {response}")
+            logger.info("Add Button response: %s", response)
             return response
             
         except Exception as e:
@@ -221,14 +221,14 @@ def register_umg_tools(mcp: FastMCP):
                 "function_name": function_name
             }
             
-            logger.info(f"Binding widget event with params: {params}")
+            logger.info("Binding widget event with params: %s", params)
             response = unreal.send_command("bind_widget_event", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Bind widget event response: {response}")
+            logger.info("Bind widget event response: %s", response)
             return response
             
         except Exception as e:
@@ -265,14 +265,14 @@ def register_umg_tools(mcp: FastMCP):
                 "z_order": z_order
             }
             
-            logger.info(f"Adding widget to viewport with params: {params}")
+            logger.info("Adding widget to viewport with params: %s", params)
             response = unreal.send_command("add_widget_to_viewport", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Add widget to viewport response: {response}")
+            logger.info("Add widget to viewport response: %s", response)
             return response
             
         except Exception as e:
@@ -315,14 +315,14 @@ def register_umg_tools(mcp: FastMCP):
                 "binding_type": binding_type
             }
             
-            logger.info(f"Setting text block binding with params: {params}")
+            logger.info("Setting text block binding with params: %s", params)
             response = unreal.send_command("set_text_block_binding", params)
             
             if not response:
                 logger.error("No response from Unreal Engine")
                 return {"success": False, "message": "No response from Unreal Engine"}
             
-            logger.info(f"Set text block binding response: {response}")
+            logger.info("Set text block binding response: %s", response)
             return response
             
         except Exception as e:
@@ -5,6 +5,7 @@ A simple MCP server for interacting with Unreal Engine.
 """
 
 import argparse
+import asyncio
 import hashlib
 import json
 import logging
@@ -12,8 +13,10 @@ import os
 import platform
 import socket
 import sys
+import threading
 import time
 import uuid
+from concurrent.futures import Future, TimeoutError as FuturesTimeoutError
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -24,9 +27,11 @@ from copy import deepcopy
 
 from mcp.server.fastmcp import FastMCP
 
+from io_worker import IOWorker
 from protocol import (
     ProtocolError,
     current_timestamp_ms,
+    encode_command_frame,
     read_frame,
     write_frame,
 )
@@ -117,6 +122,9 @@ def get_server_config() -> EnforcementConfig:
 
 AUDIT_LOG = Path("logs/audit.jsonl")
 
+# Shared stand-in for omitted params; treat as read-only.
+_EMPTY_PARAMS: Dict[str, Any] = {}
+
 
 def _env_bool(name: str) -> Optional[bool]:
     value = os.getenv(name)
@@ -130,6 +138,16 @@ def _env_bool(name: str) -> Optional[bool]:
     return None
 
 
+def _env_int(name: str) -> Optional[int]:
+    value = os.getenv(name)
+    if value is None:
+        return None
+    try:
+        return int(value.strip())
+    except ValueError:
+        return None
+
+
 def configure_server_from_args(argv: List[str]) -> None:
     parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument("--allow-write", dest="allow_write", action="store_true")
@@ -193,6 +211,8 @@ class UnrealConnection:
     HANDSHAKE_TIMEOUT = 10.0
     WRITE_TIMEOUT = 5.0
     IDLE_TIMEOUT = 60.0
+    HEARTBEAT_INTERVAL = 15.0
+    HEARTBEAT_TIMEOUT = 2.0
     ENGINE_VERSION = "5.6.x"
     CLIENT_VERSION = "python-mcp/1.0.0"
 
@@ -201,14 +221,15 @@ class UnrealConnection:
         self.connected = False
         self.session_id = str(uuid.uuid4())
         self.capabilities: list[str] = []
-        now = time.monotonic()
-        self._last_receive = now
-        self._last_send = now
         self.last_handshake: Optional[datetime] = None
         self.remote_engine_version: Optional[str] = None
         self.remote_plugin_version: Optional[str] = None
         self.window_max: int = 16
         self.resume_token: Optional[str] = None
+        # Requests are handed to a single I/O worker that owns the socket; the lock
+        # only guards swapping the worker, never socket I/O.
+        self._tx_lock = threading.Lock()
+        self._worker: Optional[IOWorker] = None
 
     def connect(self) -> bool:
         """Connect to the Unreal Engine instance and perform handshake."""
@@ -220,14 +241,34 @@ class UnrealConnection:
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+            for option, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3)):
+                option_id = getattr(socket, option, None)
+                if option_id is not None:
+                    try:
+                        sock.setsockopt(socket.IPPROTO_TCP, option_id, value)
+                    except OSError:
+                        pass
+            # Leave buffer sizing to the kernel (fixed sizes disable autotuning) unless
+            # UNREAL_SOCKBUF explicitly asks for one.
+            sockbuf = _env_int("UNREAL_SOCKBUF")
+            if sockbuf and sockbuf > 0:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, sockbuf)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sockbuf)
+            # Cap unsent data queued in the kernel so small command frames are not stuck
+            # behind a deep send queue (Linux/macOS only).
+            notsent_lowat = getattr(socket, "TCP_NOTSENT_LOWAT", None)
+            if notsent_lowat is not None:
+                try:
+                    sock.setsockopt(socket.IPPROTO_TCP, notsent_lowat, 16384)
+                except OSError:
+                    pass
             sock.settimeout(None)
             sock.connect((UNREAL_HOST, UNREAL_PORT))
 
             self.socket = sock
             self.connected = True
             self._perform_handshake()
+            self._start_worker(sock)
             logger.info("Connected to Unreal Engine (capabilities=%s)", self.capabilities)
             return True
 
@@ -243,13 +284,51 @@ class UnrealConnection:
     def disconnect(self) -> None:
         """Disconnect from the Unreal Engine instance."""
 
-        if self.socket:
+        with self._tx_lock:
+            worker = self._worker
+            sock = self.socket
+            self._worker = None
+            self.socket = None
+            self.connected = False
+
+        if worker is not None:
+            worker.stop()
+        elif sock:
             try:
-                self.socket.close()
+                sock.close()
             except OSError:
                 pass
-        self.socket = None
-        self.connected = False
+
+    def _start_worker(self, sock: socket.socket) -> None:
+        worker = IOWorker(
+            sock,
+            window_max=self.window_max,
+            write_timeout=self.WRITE_TIMEOUT,
+            idle_timeout=self.IDLE_TIMEOUT,
+            heartbeat_interval=self.HEARTBEAT_INTERVAL,
+            heartbeat_timeout=self.HEARTBEAT_TIMEOUT,
+            on_close=self._worker_closed,
+        )
+        with self._tx_lock:
+            self._worker = worker
+        worker.start()
+
+    def _submit(self, frame: bytes, request_id: str) -> Future:
+        """Queue an encoded request frame for the I/O worker and return its pending result."""
+
+        with self._tx_lock:
+            worker = self._worker
+        if worker is None:
+            raise ProtocolError("INTERNAL_ERROR", "Not connected to Unreal.")
+        return worker.submit(frame, request_id)
+
+    def _worker_closed(self, worker: IOWorker) -> None:
+        with self._tx_lock:
+            if self._worker is worker:
+                self._worker = None
+            if self.socket is worker.sock:
+                self.socket = None
+                self.connected = False
 
     def _perform_handshake(self) -> None:
         if not self.socket:
@@ -271,9 +350,6 @@ class UnrealConnection:
             raise ProtocolError("PROTOCOL_VERSION_MISMATCH", "Protocol handshake rejected.", {"response": ack})
 
         self.capabilities = list(ack.get("capabilities", []))
-        now = time.monotonic()
-        self._last_send = now
-        self._last_receive = now
         self.remote_plugin_version = ack.get("serverVersion")
         self.last_handshake = datetime.now(timezone.utc)
 
@@ -317,46 +393,10 @@ class UnrealConnection:
 
         try:
             write_frame(self.socket, payload, timeout=self.WRITE_TIMEOUT)
-            self._last_send = time.monotonic()
             logger.debug("Sent enforcement capabilities: %s", enforcement)
         except ProtocolError as exc:
             logger.error("Failed to send enforcement capabilities: %s", exc)
 
-    def _handle_control_message(self, message: Dict[str, Any]) -> bool:
-        if not self.socket:
-            return False
-
-        message_type = message.get("type")
-        if message_type == "ping":
-            timestamp = int(message.get("ts", current_timestamp_ms()))
-            try:
-                write_frame(self.socket, {"type": "pong", "ts": timestamp}, timeout=self.WRITE_TIMEOUT)
-                self._last_send = time.monotonic()
-                logger.debug("Responded to ping (%s)", timestamp)
-            except ProtocolError as exc:
-                logger.error("Failed to respond to ping: %s", exc)
-                raise
-            return True
-
-        if message_type == "pong":
-            logger.debug("Received pong (%s)", message.get("ts"))
-            return True
-
-        return False
-
-    def _wait_for_message(self) -> Dict[str, Any]:
-        if not self.socket:
-            raise ProtocolError("READ_TIMEOUT", "Socket not connected.")
-
-        deadline = time.monotonic() + self.IDLE_TIMEOUT
-        while True:
-            remaining = max(0.0, deadline - time.monotonic())
-            message = read_frame(self.socket, timeout=remaining)
-            self._last_receive = time.monotonic()
-            if self._handle_control_message(message):
-                continue
-            return message
-
     def send_command(
         self,
         command: str,
@@ -366,7 +406,7 @@ class UnrealConnection:
     ) -> Optional[Dict[str, Any]]:
         """Send a command to Unreal Engine and wait for a framed response."""
 
-        params = params or {}
+        params = params if params else _EMPTY_PARAMS
         is_mutation = command in MUTATING_COMMANDS
         request_id = request_id or str(uuid.uuid4())
         idempotency_key = request_id
@@ -411,18 +451,9 @@ class UnrealConnection:
                 logger.error("Failed to connect to Unreal Engine for command")
                 return None
 
-        payload = {
-            "type": command,
-            "params": params,
-            "requestId": request_id,
-            "idempotencyKey": idempotency_key,
-            "meta": {"requestId": request_id, "ts": start_ts_ms},
-        }
-
         try:
-            write_frame(self.socket, payload, timeout=self.WRITE_TIMEOUT)
-            self._last_send = time.monotonic()
-            response = self._wait_for_message()
+            frame = encode_command_frame(command, params, request_id, start_ts_ms)
+            response = self._wait_for_reply(self._submit(frame, request_id))
             logger.debug("Received response payload: %s", response)
             duration_ms = (time.time() - start_time) * 1000.0
             if isinstance(response, dict):
@@ -430,19 +461,20 @@ class UnrealConnection:
                 meta.setdefault("requestId", request_id)
                 meta["serverTs"] = start_ts_ms
                 meta["durMs"] = duration_ms
-                fields = {
-                    "tool": command,
-                    "ok": bool(response.get("ok", False)),
-                    "durMs": duration_ms,
-                }
-                if isinstance(response.get("error"), dict):
-                    code = response["error"].get("code")
-                    if code:
-                        fields["errorCode"] = code
+                ok = bool(response.get("ok", False))
+                error_code = None
+                if not ok:
+                    error = response.get("error")
+                    if isinstance(error, dict):
+                        error_code = error.get("code") or None
+                counter_fields: Dict[str, Any] = {"tool": command, "ok": ok}
+                if error_code:
+                    counter_fields["errorCode"] = error_code
+                fields = {**counter_fields, "durMs": duration_ms}
                 log_metric("tool_duration_ms", fields)
-                log_metric("tool_calls_total", {k: fields[k] for k in ("tool", "ok") if k in fields} | ({"errorCode": fields["errorCode"]} if "errorCode" in fields else {}))
+                log_metric("tool_calls_total", counter_fields)
                 log_event(
-                    "info" if response.get("ok") else "error",
+                    "info" if ok else "error",
                     f"tool.{command}",
                     f"Tool {command} completed",
                     request_id=request_id,
@@ -460,7 +492,6 @@ class UnrealConnection:
             error_payload = exc.to_dict()
             if is_mutation:
                 self._emit_audit(command, params, error_payload)
-            self.disconnect()
             log_event(
                 "error",
                 f"tool.{command}",
@@ -474,7 +505,6 @@ class UnrealConnection:
             return error_payload
         except Exception as exc:  # pragma: no cover - defensive logging
             logger.error("Unexpected error while sending command: %s", exc)
-            self.disconnect()
             error_payload = {
                 "ok": False,
                 "error": {
@@ -497,6 +527,30 @@ class UnrealConnection:
             DEDUP_STORE.put(idempotency_key, deepcopy(error_payload))
             return error_payload
 
+    def _wait_for_reply(self, future: Future) -> Dict[str, Any]:
+        """Wait for the I/O worker to resolve ``future`` without blocking forever.
+
+        The worker bounds every read, so a request it has picked up can only outlive the
+        budget if the worker is stuck; the connection is then reset. The budget restarts
+        at pickup because a queued request may first wait behind a batch in flight; one
+        still queued when it runs out is cancelled before anything reaches Unreal.
+        """
+
+        # A sent request may sit behind window_max - 1 others in its batch, each of
+        # which the worker allows IDLE_TIMEOUT.
+        budget = self.WRITE_TIMEOUT + self.window_max * self.IDLE_TIMEOUT + 5.0
+        try:
+            return future.result(timeout=budget)
+        except FuturesTimeoutError:
+            if future.cancel():
+                raise ProtocolError("READ_TIMEOUT", "Timed out before the request was sent to Unreal.") from None
+        try:
+            return future.result(timeout=budget)
+        except FuturesTimeoutError:
+            logger.error("Unreal I/O worker stopped making progress; resetting the connection")
+            self.disconnect()
+            raise ProtocolError("READ_TIMEOUT", "Timed out waiting for Unreal to respond.") from None
+
     def _emit_audit(self, command: str, params: Dict[str, Any], response: Dict[str, Any]) -> None:
         if command not in MUTATING_COMMANDS:
             return
@@ -558,7 +612,7 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
     global _unreal_connection
     logger.info("UnrealMCP server starting up")
     try:
-        _unreal_connection = get_unreal_connection()
+        _unreal_connection = await asyncio.to_thread(get_unreal_connection)
         if _unreal_connection:
             logger.info("Connected to Unreal Engine on startup")
         else: